@@ -59,6 +59,7 @@ class CloudCache:
         )
         self.cache_type_confirmed = False
         self._dir_info = {}
+        self._existing_dir_hashes = set()
 
     def get_dir_cache(self, hash_info):
         assert hash_info
@@ -75,6 +76,22 @@ class CloudCache:
         self._dir_info[hash_info.value] = dir_info
         return dir_info
 
+    def dir_cache_exists(self, hash_info):
+        """Check whether the .dir cache file for hash_info exists.
+
+        Positive results are remembered for the lifetime of this cache
+        instance (and forgotten again if the file gets removed by us), so
+        repeatedly resolving the same directory hash doesn't stat it again.
+        """
+        if hash_info.value in self._existing_dir_hashes:
+            return True
+
+        path_info = self.tree.hash_to_path_info(hash_info.value)
+        exists = self.tree.exists(path_info)
+        if exists:
+            self._existing_dir_hashes.add(hash_info.value)
+        return exists
+
     def load_dir_cache(self, hash_info):
         path_info = self.tree.hash_to_path_info(hash_info.value)
 
@@ -109,7 +126,7 @@ class CloudCache:
         filtered_dir_info = DirInfo()
         try:
             for key, value in dir_info.trie.items(hash_key):
-                filtered_dir_info.trie[key[depth:]] = value
+                filtered_dir_info.add(key[depth:], value)
         except KeyError:
             return None
 
@@ -310,7 +327,7 @@ class CloudCache:
             for entry_info, entry_hash in self._transfer_directory_contents(
                 from_tree, from_info, jobs, pbar
             ):
-                dir_info.trie[entry_info.parts] = entry_hash
+                dir_info.add(entry_info.parts, entry_hash)
 
         local_cache = self.repo.cache.local
         (
@@ -517,6 +534,7 @@ class CloudCache:
         if self.tree.exists(cache_info):
             logger.warning("corrupted cache file '%s'.", cache_info)
             self.tree.remove(cache_info)
+            self._existing_dir_hashes.discard(hash_info.value)
 
         return True
 
@@ -900,7 +918,7 @@ class CloudCache:
         keeping all of it in memory.
         """
         num_pages = remote_size / self.tree.LIST_OBJECT_PAGE_SIZE
-        if num_pages < 256 / self.tree.JOBS:
+        if num_pages < 256 / self.tree.jobs:
             # Fetching prefixes in parallel requires at least 255 more
             # requests, for small enough remotes it will be faster to fetch
             # entire cache without splitting it into prefixes.
@@ -936,7 +954,7 @@ class CloudCache:
                 )
 
             with ThreadPoolExecutor(
-                max_workers=jobs or self.tree.JOBS
+                max_workers=jobs or self.tree.jobs
             ) as executor:
                 in_remote = executor.map(list_with_update, traverse_prefixes,)
                 yield from itertools.chain.from_iterable(in_remote)
@@ -980,6 +998,7 @@ class CloudCache:
                 # pylint: disable=protected-access
                 self._remove_unpacked_dir(hash_)
             self.tree.remove(path_info)
+            self._existing_dir_hashes.discard(hash_)
             removed = True
 
         return removed
@@ -1004,7 +1023,7 @@ class CloudCache:
                 return ret
 
             with ThreadPoolExecutor(
-                max_workers=jobs or self.tree.JOBS
+                max_workers=jobs or self.tree.jobs
             ) as executor:
                 path_infos = map(self.tree.hash_to_path_info, hashes)
                 in_remote = executor.map(exists_with_progress, path_infos)
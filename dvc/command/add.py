@@ -102,7 +102,8 @@ def add_parser(subparsers, parent_parser):
         type=int,
         help=(
             "Number of jobs to run simultaneously. "
-            "The default value is 4 * cpu_count(). "
+            "The default value is 4 * the number of available CPUs, "
+            "capped at 64 for remotes (32 for S3, 16 for HTTP(S)). "
             "For SSH remotes, the default is 4. "
         ),
         metavar="<number>",
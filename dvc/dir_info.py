@@ -48,24 +48,50 @@ class DirInfo:
     PARAM_RELPATH = "relpath"
 
     def __init__(self):
-        self.trie = Trie()
+        self._trie = Trie()
+        # NOTE: entries added with add() are kept in these parallel lists
+        # and only inserted into the trie once it is actually accessed, as
+        # most callers just iterate over all entries and never need the trie.
+        self._keys = []
+        self._hash_infos = []
+
+    @property
+    def trie(self):
+        if self._keys:
+            for key, hash_info in zip(self._keys, self._hash_infos):
+                self._trie[key] = hash_info
+            self._keys = []
+            self._hash_infos = []
+        return self._trie
+
+    @trie.setter
+    def trie(self, trie):
+        self._trie = trie
+        self._keys = []
+        self._hash_infos = []
+
+    def add(self, key, hash_info):
+        """Add entry for a new (not yet present) key to this DirInfo."""
+        self._keys.append(key)
+        self._hash_infos.append(hash_info)
+
+    def _iteritems(self):
+        yield from self._trie.iteritems()  # noqa: B301
+        yield from zip(self._keys, self._hash_infos)
 
     @property
     def size(self):
         try:
-            return sum(
-                hash_info.size
-                for _, hash_info in self.trie.iteritems()  # noqa: B301
-            )
+            return sum(hash_info.size for _, hash_info in self._iteritems())
         except TypeError:
             return None
 
     @property
     def nfiles(self):
-        return len(self.trie)
+        return len(self._trie) + len(self._keys)
 
     def items(self, path_info=None):
-        for key, hash_info in self.trie.iteritems():  # noqa: B301
+        for key, hash_info in self._iteritems():
             path = posixpath.sep.join(key)
             if path_info is not None:
                 path = path_info / path
@@ -78,7 +104,7 @@ class DirInfo:
             entry = _entry.copy()
             relpath = entry.pop(cls.PARAM_RELPATH)
             parts = tuple(relpath.split(posixpath.sep))
-            ret.trie[parts] = HashInfo.from_dict(entry)
+            ret.add(parts, HashInfo.from_dict(entry))
         return ret
 
     def to_list(self):
@@ -91,7 +117,7 @@ class DirInfo:
                     hash_info.name: hash_info.value,
                     self.PARAM_RELPATH: posixpath.sep.join(parts),
                 }
-                for parts, hash_info in self.trie.iteritems()  # noqa: B301
+                for parts, hash_info in self._iteritems()
             ),
             key=itemgetter(self.PARAM_RELPATH),
         )
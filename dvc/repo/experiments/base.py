@@ -1,3 +1,4 @@
+import sys
 from typing import Optional
 
 from dvc.exceptions import DvcException, InvalidArgumentError
@@ -137,6 +138,10 @@ class ExpRefInfo:
                 InvalidExpRefError(ref)
         except ValueError:
             raise InvalidExpRefError(ref)
-        baseline_sha = parts[2] + parts[3] if len(parts) >= 4 else None
+        # NOTE: many exp refs share the same baseline, intern it so that they
+        # share the same string (see gc())
+        baseline_sha = (
+            sys.intern(parts[2] + parts[3]) if len(parts) >= 4 else None
+        )
         name = parts[4] if len(parts) == 5 else None
         return cls(baseline_sha, name)
@@ -1,9 +1,10 @@
 import logging
+import sys
 from typing import Optional
 
 from dvc.repo import locked
 
-from .base import EXEC_APPLY, EXEC_BRANCH, EXEC_CHECKPOINT
+from .base import EXEC_APPLY, EXEC_BRANCH, EXEC_CHECKPOINT, EXPS_NAMESPACE
 from .utils import exp_refs
 
 logger = logging.getLogger(__name__)
@@ -18,7 +19,13 @@ def gc(
     workspace: Optional[bool] = False,
     queued: Optional[bool] = False,
 ):
-    keep_revs = set(
+    # NOTE: the experiments stash also lives under EXPS_NAMESPACE, so if
+    # there are no refs there is nothing to collect and we can skip walking
+    # all of the revisions to keep below.
+    if not repo.scm.has_any_ref(EXPS_NAMESPACE):
+        return 0
+
+    revs = set(
         repo.brancher(
             all_branches=all_branches,
             all_tags=all_tags,
@@ -27,34 +34,48 @@ def gc(
         )
     )
     if workspace:
-        keep_revs.add(repo.scm.get_rev())
+        revs.add(repo.scm.get_rev())
+    # NOTE: ExpRefInfo interns baseline SHAs as well, so checking them
+    # against keep_revs below is mostly an identity check
+    keep_revs = frozenset(map(sys.intern, revs))
 
     if not keep_revs:
         return 0
 
     exec_branch = repo.scm.get_ref(EXEC_BRANCH, follow=False)
-    exec_apply = repo.scm.get_ref(EXEC_APPLY)
-    exec_checkpoint = repo.scm.get_ref(EXEC_CHECKPOINT)
-
-    removed = 0
-    for ref_info in exp_refs(repo.scm):
-        if ref_info.baseline_sha not in keep_revs:
-            ref = repo.scm.get_ref(str(ref_info))
-            if exec_branch and str(ref_info):
-                repo.scm.remove_ref(EXEC_BRANCH)
-            if exec_apply and exec_apply == ref:
-                repo.scm.remove_ref(EXEC_APPLY)
-            if exec_checkpoint and exec_checkpoint == ref:
-                repo.scm.remove_ref(EXEC_CHECKPOINT)
-            repo.scm.remove_ref(str(ref_info))
-            removed += 1
-
-    delete_stashes = []
-    for _, entry in repo.experiments.stash_revs.items():
-        if not queued or entry.baseline_rev not in keep_revs:
-            delete_stashes.append(entry.index)
-    for index in sorted(delete_stashes, reverse=True):
-        repo.experiments.stash.drop(index)
+
+    to_delete = [
+        str(ref_info)
+        for ref_info in exp_refs(repo.scm)
+        if ref_info.baseline_sha not in keep_revs
+    ]
+    stale_refnames = set(to_delete)
+
+    # resolve all experiment refs (exec refs included) at once rather than
+    # one git call per ref
+    refs = repo.scm.get_refs(EXPS_NAMESPACE)
+    stale_revs = {refs[name] for name in to_delete if name in refs}
+
+    if exec_branch and exec_branch in stale_refnames:
+        repo.scm.remove_ref(EXEC_BRANCH)
+
+    # exec refs pointing to a removed experiment are removed along with it
+    exec_to_clear = [
+        name
+        for name in (EXEC_APPLY, EXEC_CHECKPOINT)
+        if refs.get(name) in stale_revs
+    ]
+
+    if to_delete or exec_to_clear:
+        repo.scm.remove_refs(to_delete + exec_to_clear)
+    removed = len(to_delete)
+
+    delete_stashes = [
+        entry.index
+        for entry in repo.experiments.stash_revs.values()
+        if not queued or entry.baseline_rev not in keep_revs
+    ]
+    repo.experiments.stash.drop_many(delete_stashes)
     removed += len(delete_stashes)
 
     return removed
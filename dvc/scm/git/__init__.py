@@ -373,7 +373,10 @@ class Git(Base):
     set_ref = partialmethod(_backend_func, "set_ref")
     get_ref = partialmethod(_backend_func, "get_ref")
     remove_ref = partialmethod(_backend_func, "remove_ref")
+    remove_refs = partialmethod(_backend_func, "remove_refs")
     iter_refs = partialmethod(_backend_func, "iter_refs")
+    get_refs = partialmethod(_backend_func, "get_refs")
+    has_any_ref = partialmethod(_backend_func, "has_any_ref")
     iter_remote_refs = partialmethod(_backend_func, "iter_remote_refs")
     get_refs_containing = partialmethod(_backend_func, "get_refs_containing")
     push_refspec = partialmethod(_backend_func, "push_refspec")
@@ -1,6 +1,6 @@
 import os
 from abc import ABC, abstractmethod
-from typing import Callable, Iterable, Mapping, Optional, Tuple
+from typing import Callable, Dict, Iterable, Mapping, Optional, Tuple
 
 from dvc.scm.base import SCMError
 
@@ -166,6 +166,10 @@ class BaseGitBackend(ABC):
         equals old_ref.
         """
 
+    @abstractmethod
+    def remove_refs(self, names: Iterable[str]):
+        """Remove all of the specified git refs in a single operation."""
+
     @abstractmethod
     def iter_refs(self, base: Optional[str] = None):
         """Iterate over all refs in this git repo.
@@ -173,6 +177,27 @@ class BaseGitBackend(ABC):
         If base is specified, only refs which begin with base will be yielded.
         """
 
+    @abstractmethod
+    def get_refs(self, base: Optional[str] = None) -> Dict[str, str]:
+        """Return a mapping of refname to SHA for all refs in this git repo.
+
+        Symbolic refs will be dereferenced. Unlike calling get_ref() for each
+        refname, all refs are resolved in a single pass.
+
+        If base is specified, only base itself and refs under base (matched
+        by whole path components, like `git for-each-ref`) will be included.
+        """
+
+    @abstractmethod
+    def has_any_ref(self, base: Optional[str] = None) -> bool:
+        """Return True if this git repo has at least one ref.
+
+        If base is specified, only base itself and refs under base (matched
+        by whole path components, like `git for-each-ref`) will be
+        considered. Unlike iter_refs()/get_refs(), this stops at the first
+        matching ref.
+        """
+
     @abstractmethod
     def iter_remote_refs(self, url: str, base: Optional[str] = None):
         """Iterate over all refs in the specified remote Git repo.
@@ -253,9 +278,14 @@ class BaseGitBackend(ABC):
 
     @abstractmethod
     def reflog_delete(
-        self, ref: str, updateref: bool = False, rewrite: bool = False
+        self, *refs: str, updateref: bool = False, rewrite: bool = False
     ):
-        """Delete the specified reflog entry."""
+        """Delete the specified reflog entries.
+
+        Entries are deleted one after another, in the order they are given,
+        so multiple entries from the same reflog should be given with their
+        indices in descending order.
+        """
 
     @abstractmethod
     def describe(
@@ -288,6 +288,9 @@ class DulwichBackend(BaseGitBackend):  # pylint:disable=abstract-method
         if not self.repo.refs.remove_if_equals(name_b, old_ref_b):
             raise SCMError(f"Failed to remove '{name}'")
 
+    def remove_refs(self, names: Iterable[str]):
+        raise NotImplementedError
+
     def iter_refs(self, base: Optional[str] = None):
         base_b = os.fsencode(base) if base else None
         for key in self.repo.refs.keys(base=base_b):
@@ -298,6 +301,32 @@ class DulwichBackend(BaseGitBackend):  # pylint:disable=abstract-method
             else:
                 yield os.fsdecode(key)
 
+    def get_refs(self, base: Optional[str] = None) -> Dict[str, str]:
+        if not base:
+            return {
+                os.fsdecode(key): os.fsdecode(sha)
+                for key, sha in self.repo.refs.as_dict().items()
+            }
+        base = base.rstrip("/")
+        base_b = os.fsencode(base)
+        refs = {
+            f"{base}/{os.fsdecode(key)}": os.fsdecode(sha)
+            for key, sha in self.repo.refs.as_dict(base=base_b + b"/").items()
+        }
+        try:
+            refs[base] = os.fsdecode(self.repo.refs[base_b])
+        except KeyError:
+            pass
+        return refs
+
+    def has_any_ref(self, base: Optional[str] = None) -> bool:
+        if not base:
+            return bool(self.repo.refs.allkeys())
+        base_b = os.fsencode(base.rstrip("/"))
+        return base_b in self.repo.refs or bool(
+            self.repo.refs.keys(base=base_b + b"/")
+        )
+
     def iter_remote_refs(self, url: str, base: Optional[str] = None):
         from dulwich.client import get_transport_and_path
         from dulwich.porcelain import get_remote_repo
@@ -505,7 +534,7 @@ class DulwichBackend(BaseGitBackend):  # pylint:disable=abstract-method
         raise NotImplementedError
 
     def reflog_delete(
-        self, ref: str, updateref: bool = False, rewrite: bool = False
+        self, *refs: str, updateref: bool = False, rewrite: bool = False
     ):
         raise NotImplementedError
 
@@ -3,7 +3,7 @@ import locale
 import logging
 import os
 from functools import partial
-from typing import Callable, Iterable, Mapping, Optional, Tuple
+from typing import Callable, Dict, Iterable, Mapping, Optional, Tuple
 
 from funcy import first, ignore
 
@@ -415,12 +415,58 @@ class GitPythonBackend(BaseGitBackend):  # pylint:disable=abstract-method
         except GitCommandError as exc:
             raise SCMError(f"Failed to set ref '{name}'") from exc
 
+    def remove_refs(self, names: Iterable[str]):
+        from tempfile import TemporaryFile
+
+        from git.exc import GitCommandError
+
+        # single `update-ref --stdin` transaction instead of spawning one
+        # `update-ref -d` process (and rewriting packed-refs) per ref
+        with TemporaryFile() as fobj:
+            for name in names:
+                fobj.write(f"delete {name}\0\0".encode("utf-8"))
+            if not fobj.tell():
+                return
+            fobj.seek(0)
+            try:
+                self.git.update_ref("--stdin", "-z", istream=fobj)
+            except GitCommandError as exc:
+                raise SCMError("Failed to remove refs") from exc
+
     def iter_refs(self, base: Optional[str] = None):
         from git import Reference
 
         for ref in Reference.iter_items(self.repo, common_path=base):
             yield ref.path
 
+    def get_refs(self, base: Optional[str] = None) -> Dict[str, str]:
+        from git.exc import GitCommandError
+
+        args = [base] if base else []
+        try:
+            out = self.git.for_each_ref(
+                *args, format=r"%(refname) %(objectname)"
+            )
+        except GitCommandError as exc:
+            raise SCMError("Failed to list refs") from exc
+
+        refs = {}
+        for line in out.splitlines():
+            refname, _, sha = line.strip().rpartition(" ")
+            if refname:
+                refs[refname] = sha
+        return refs
+
+    def has_any_ref(self, base: Optional[str] = None) -> bool:
+        from git.exc import GitCommandError
+
+        args = [base] if base else []
+        try:
+            out = self.git.for_each_ref(*args, count=1, format=r"%(refname)")
+        except GitCommandError as exc:
+            raise SCMError("Failed to list refs") from exc
+        return bool(out.strip())
+
     def iter_remote_refs(self, url: str, base: Optional[str] = None):
         raise NotImplementedError
 
@@ -503,14 +549,14 @@ class GitPythonBackend(BaseGitBackend):  # pylint:disable=abstract-method
             raise SCMError("Could not apply stash") from exc
 
     def reflog_delete(
-        self, ref: str, updateref: bool = False, rewrite: bool = False
+        self, *refs: str, updateref: bool = False, rewrite: bool = False
     ):
         args = ["delete"]
         if updateref:
             args.append("--updateref")
         if rewrite:
             args.append("--rewrite")
-        args.append(ref)
+        args.extend(refs)
         self.git.reflog(*args)
 
     def describe(
@@ -2,7 +2,7 @@ import locale
 import logging
 import os
 from io import BytesIO, StringIO
-from typing import Callable, Iterable, List, Mapping, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from dvc.scm.base import MergeConflictError, RevError, SCMError
 from dvc.utils import relpath
@@ -221,11 +221,43 @@ class Pygit2Backend(BaseGitBackend):  # pylint:disable=abstract-method
             raise SCMError(f"Failed to remove '{name}'")
         ref.delete()
 
+    def remove_refs(self, names: Iterable[str]):
+        raise NotImplementedError
+
     def iter_refs(self, base: Optional[str] = None):
         for ref in self.repo.references:
             if ref.startswith(base):
                 yield ref
 
+    def get_refs(self, base: Optional[str] = None) -> Dict[str, str]:
+        from pygit2 import GIT_REF_SYMBOLIC
+
+        if base:
+            base = base.rstrip("/")
+            prefix = f"{base}/"
+        refs = {}
+        for name in self.repo.references:
+            if base and not (name == base or name.startswith(prefix)):
+                continue
+            ref = self.repo.references[name]
+            if ref.type == GIT_REF_SYMBOLIC:
+                try:
+                    ref = ref.resolve()
+                except KeyError:
+                    continue
+            refs[name] = str(ref.target)
+        return refs
+
+    def has_any_ref(self, base: Optional[str] = None) -> bool:
+        if not base:
+            return any(True for _ in self.repo.references)
+        base = base.rstrip("/")
+        prefix = f"{base}/"
+        return any(
+            name == base or name.startswith(prefix)
+            for name in self.repo.references
+        )
+
     def get_refs_containing(self, rev: str, pattern: Optional[str] = None):
         raise NotImplementedError
 
@@ -263,7 +295,7 @@ class Pygit2Backend(BaseGitBackend):  # pylint:disable=abstract-method
         raise NotImplementedError
 
     def reflog_delete(
-        self, ref: str, updateref: bool = False, rewrite: bool = False
+        self, *refs: str, updateref: bool = False, rewrite: bool = False
     ):
         raise NotImplementedError
 
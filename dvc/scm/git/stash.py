@@ -2,7 +2,7 @@
 
 import logging
 import os
-from typing import Optional
+from typing import Iterable, Optional
 
 from dvc.scm.base import SCMError
 from dvc.utils.fs import remove
@@ -62,11 +62,27 @@ class Stash:
         self.scm._stash_apply(rev)  # pylint: disable=protected-access
 
     def drop(self, index: int = 0):
-        ref = "{0}@{{{1}}}".format(self.ref, index)
-        if index < 0 or index >= len(self):
-            raise SCMError(f"Invalid stash ref '{ref}'")
-        logger.debug("Dropping '%s'", ref)
-        self.scm.reflog_delete(ref, updateref=True, rewrite=True)
+        self.drop_many([index])
+
+    def drop_many(self, indices: Iterable[int]):
+        """Drop the specified stash entries with a single reflog delete,
+        rather than one `drop()` (and git call) per entry.
+        """
+        # NOTE: dropping an entry shifts the indices of the older ones, so
+        # entries have to be dropped starting from the oldest one
+        indices = sorted(set(indices), reverse=True)
+        if not indices:
+            return
+
+        size = len(self)
+        refs = []
+        for index in indices:
+            ref = "{0}@{{{1}}}".format(self.ref, index)
+            if index < 0 or index >= size:
+                raise SCMError(f"Invalid stash ref '{ref}'")
+            refs.append(ref)
+        logger.debug("Dropping '%s'", "', '".join(refs))
+        self.scm.reflog_delete(*refs, updateref=True, rewrite=True)
 
         # if we removed the last reflog entry, delete the ref and reflog
         if len(self) == 0:
@@ -4,12 +4,18 @@ import logging
 import os
 import re
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from urllib.parse import urlencode, urlunparse
 
 from dvc.exceptions import DvcException
 from dvc.hash_info import HashInfo
 from dvc.utils import current_timestamp, relpath, to_chunks
-from dvc.utils.fs import get_inode, get_mtime_and_size, remove
+from dvc.utils.fs import (
+    get_entry_inode_mtime_and_size,
+    get_inode,
+    get_mtime_and_size,
+    remove,
+)
 
 SQLITE_MAX_VARIABLES_NUMBER = 999
 
@@ -43,10 +49,22 @@ class StateBase(ABC):
     def save(self, path_info, hash_info):
         pass
 
+    @abstractmethod
+    def save_many(self, items):
+        pass
+
     @abstractmethod
     def get(self, path_info):
         pass
 
+    @abstractmethod
+    def stat_many(self, path_infos, entries=None):
+        pass
+
+    @abstractmethod
+    def get_many(self, stats):
+        pass
+
     @abstractmethod
     def save_link(self, path_info):
         pass
@@ -79,9 +97,20 @@ class StateNoop(StateBase):
     def save(self, path_info, hash_info):
         pass
 
+    def save_many(self, items):
+        pass
+
     def get(self, path_info):  # pylint: disable=unused-argument
         return None
 
+    def stat_many(
+        self, path_infos, entries=None
+    ):  # pylint: disable=unused-argument
+        return {}
+
+    def get_many(self, stats):  # pylint: disable=unused-argument
+        return {}
+
     def save_link(self, path_info):
         pass
 
@@ -171,6 +200,10 @@ class State(StateBase):  # pylint: disable=too-many-instance-attributes
         logger.trace(cmd)
         return self.cursor.execute(cmd, parameters)
 
+    def _executemany(self, cmd, seq_of_parameters):
+        logger.trace(cmd)
+        return self.cursor.executemany(cmd, seq_of_parameters)
+
     def _fetchall(self):
         ret = self.cursor.fetchall()
         logger.trace("fetched: %s", ret)
@@ -424,6 +457,68 @@ class State(StateBase):  # pylint: disable=too-many-instance-attributes
             actual_inode, actual_mtime, actual_size, hash_info.value
         )
 
+    def save_many(self, items):
+        """Save hashes for multiple files at once.
+
+        Unlike calling save() for each path info, existing records are looked
+        up with a single query per chunk of files and all inserts/updates are
+        issued as batches.
+
+        Args:
+            items (list): (stats, hash_info) pairs to save, where stats are the
+                (inode, mtime, size) that stat_many() returned for the file
+                before it was hashed. The files are not stat'ed again, so a
+                file changed since then won't match its saved record.
+        """
+        records = {}
+        for (inode, mtime, size), hash_info in items:
+            assert hash_info
+            assert isinstance(hash_info, HashInfo)
+            records[inode] = (mtime, size, hash_info.value)
+
+        existing = set()
+        for chunk in to_chunks(
+            list(records), chunk_size=SQLITE_MAX_VARIABLES_NUMBER
+        ):
+            cmd = "SELECT inode FROM {} WHERE inode IN ({})"
+            self._execute(
+                cmd.format(self.STATE_TABLE, ",".join(["?"] * len(chunk))),
+                tuple(self._to_sqlite(inode) for inode in chunk),
+            )
+            existing.update(
+                self._from_sqlite(inode) for (inode,) in self._fetchall()
+            )
+
+        timestamp = current_timestamp()
+        updates = []
+        inserts = []
+        for inode, (mtime, size, checksum) in records.items():
+            if inode in existing:
+                updates.append(
+                    (mtime, size, checksum, timestamp, self._to_sqlite(inode))
+                )
+            else:
+                inserts.append(
+                    (self._to_sqlite(inode), mtime, size, checksum, timestamp)
+                )
+
+        if updates:
+            cmd = (
+                "UPDATE {} SET "
+                "mtime = ?, size = ?, "
+                "md5 = ?, timestamp = ? "
+                "WHERE inode = ?"
+            ).format(self.STATE_TABLE)
+            self._executemany(cmd, updates)
+
+        if inserts:
+            cmd = (
+                "INSERT INTO {}(inode, mtime, size, md5, timestamp) "
+                "VALUES (?, ?, ?, ?, ?)"
+            ).format(self.STATE_TABLE)
+            self._executemany(cmd, inserts)
+            self.inserts += len(inserts)
+
     def get(self, path_info):
         """Gets the hash for the specified path info. Hash will be
         retrieved from the state database if available.
@@ -458,6 +553,97 @@ class State(StateBase):  # pylint: disable=too-many-instance-attributes
         self._update_state_record_timestamp_for_inode(actual_inode)
         return HashInfo("md5", value, size=int(actual_size))
 
+    def stat_many(self, path_infos, entries=None):
+        """Gets the inode, mtime and size of the specified path infos, as
+        used by get_many() and save_many().
+
+        Args:
+            path_infos (list): path infos to stat.
+            entries (dict): optional mapping of path info to `os.DirEntry`
+                for files, whose cached stat results are used instead of
+                stat'ing those files again.
+
+        Returns:
+            dict: mapping of path info to (inode, mtime, size) for each path
+            info which exists.
+        """
+        entries = entries or {}
+
+        ret = {}
+        for path_info in path_infos:
+            assert isinstance(path_info, str) or path_info.scheme == "local"
+
+            entry = entries.get(path_info)
+            if entry is not None:
+                try:
+                    ret[path_info] = get_entry_inode_mtime_and_size(entry)
+                except FileNotFoundError:
+                    # NOTE: broken symlink case.
+                    pass
+                continue
+
+            path = os.fspath(path_info)
+
+            # NOTE: see get() for why this is not LocalTree.exists
+            if not os.path.exists(path):
+                continue
+
+            actual_mtime, actual_size = get_mtime_and_size(path, self.tree)
+            ret[path_info] = (get_inode(path), actual_mtime, actual_size)
+
+        return ret
+
+    def get_many(self, stats):
+        """Gets the hashes for the specified path infos using a single state
+        database query per chunk of paths, rather than one query per path.
+
+        Args:
+            stats (dict): mapping of path info to (inode, mtime, size), as
+                returned by stat_many().
+
+        Returns:
+            dict: mapping of path info to HashInfo for each path info which
+            has an up-to-date entry in the state database. Path infos without
+            one are left out.
+        """
+        actual = defaultdict(list)
+        for path_info, (inode, actual_mtime, actual_size) in stats.items():
+            actual[inode].append((path_info, actual_mtime, actual_size))
+
+        ret = {}
+        found = []
+        for chunk in to_chunks(
+            list(actual), chunk_size=SQLITE_MAX_VARIABLES_NUMBER
+        ):
+            cmd = "SELECT inode, mtime, size, md5 FROM {} WHERE inode IN ({})"
+            self._execute(
+                cmd.format(self.STATE_TABLE, ",".join(["?"] * len(chunk))),
+                tuple(self._to_sqlite(inode) for inode in chunk),
+            )
+            for inode, mtime, size, value in self._fetchall():
+                inode = self._from_sqlite(inode)
+                for path_info, actual_mtime, actual_size in actual[inode]:
+                    if self._file_metadata_changed(
+                        actual_mtime, mtime, actual_size, size
+                    ):
+                        continue
+                    ret[path_info] = HashInfo(
+                        "md5", value, size=int(actual_size)
+                    )
+                    found.append(inode)
+
+        timestamp = current_timestamp()
+        for chunk in to_chunks(
+            found, chunk_size=SQLITE_MAX_VARIABLES_NUMBER - 1
+        ):
+            cmd = "UPDATE {} SET timestamp = ? WHERE inode IN ({})"
+            self._execute(
+                cmd.format(self.STATE_TABLE, ",".join(["?"] * len(chunk))),
+                (timestamp, *(self._to_sqlite(inode) for inode in chunk)),
+            )
+
+        return ret
+
     def save_link(self, path_info):
         """Adds the specified path to the list of links created by dvc. This
         list is later used on `dvc checkout` to cleanup old links.
@@ -1,11 +1,15 @@
+import itertools
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from functools import partial
-from multiprocessing import cpu_count
+import os
+from collections import deque
+from concurrent import futures
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache, partial
 from typing import Any, ClassVar, Dict, FrozenSet, Optional
 from urllib.parse import urlparse
 
-from funcy import cached_property, decorator
+from funcy import cached_property, chunks, decorator
 
 from dvc.dir_info import DirInfo
 from dvc.exceptions import DvcException, DvcIgnoreInCollectedDirError
@@ -15,7 +19,7 @@ from dvc.path_info import URLInfo
 from dvc.progress import Tqdm
 from dvc.state import StateNoop
 from dvc.utils import tmp_fname
-from dvc.utils.fs import makedirs, move
+from dvc.utils.fs import makedirs
 from dvc.utils.http import open_url
 
 logger = logging.getLogger(__name__)
@@ -50,10 +54,17 @@ class BaseTree:
     scheme = "base"
     REQUIRES: ClassVar[Dict[str, str]] = {}
     PATH_CLS = URLInfo  # type: Any
-    JOBS = 4 * cpu_count()
+    # NOTE: None means that the default number of jobs is derived from the
+    # number of CPUs available to us, see _default_jobs()/_default_hash_jobs()
+    JOBS: ClassVar[Optional[int]] = None
+    # NOTE: upper bound for the default number of jobs, too many concurrent
+    # connections only gets us throttled by most providers.
+    MAX_JOBS: ClassVar[Optional[int]] = 64
 
     CHECKSUM_DIR_SUFFIX = ".dir"
-    HASH_JOBS = max(1, min(4, cpu_count() // 2))
+    HASH_JOBS: ClassVar[Optional[int]] = None
+    HASH_CHUNK_SIZE = 100
+    STATE_CHUNK_SIZE = 1000
     LIST_OBJECT_PAGE_SIZE = 1000
     TRAVERSE_WEIGHT_MULTIPLIER = 5
     TRAVERSE_PREFIX_LEN = 3
@@ -81,17 +92,40 @@ class BaseTree:
         return (
             self.config.get("jobs")
             or (self.repo and self.repo.config["core"].get("jobs"))
-            or self.JOBS
+            or self._default_jobs()
         )
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _cpu_count():
+        # NOTE: unlike multiprocessing.cpu_count(), this only counts the CPUs
+        # that we are allowed to run on (e.g. restricted by taskset or by a
+        # cpuset in a container). sched_getaffinity is not available on
+        # Windows and macOS.
+        try:
+            return len(os.sched_getaffinity(0))
+        except AttributeError:
+            return os.cpu_count() or 1
+
+    @classmethod
+    def _default_jobs(cls):
+        jobs = cls.JOBS or 4 * cls._cpu_count()
+        if cls.MAX_JOBS:
+            return min(jobs, cls.MAX_JOBS)
+        return jobs
+
     @cached_property
     def hash_jobs(self):
         return (
             self.config.get("checksum_jobs")
             or (self.repo and self.repo.config["core"].get("checksum_jobs"))
-            or self.HASH_JOBS
+            or self._default_hash_jobs()
         )
 
+    @classmethod
+    def _default_hash_jobs(cls):
+        return cls.HASH_JOBS or max(1, min(4, cls._cpu_count() // 2))
+
     @classmethod
     def get_missing_deps(cls):
         import importlib
@@ -204,6 +238,14 @@ class BaseTree:
         """
         raise NotImplementedError
 
+    def _walk_files_entries(self, path_info, **kwargs):
+        """Same as `walk_files`, but yields `(path_info, entry)` pairs, where
+        `entry` is an `os.DirEntry` for trees that can provide one and `None`
+        otherwise.
+        """
+        for file_info in self.walk_files(path_info, **kwargs):
+            yield file_info, None
+
     def ls(self, path_info, detail=False, **kwargs):
         raise RemoteActionNotImplemented("ls", self.scheme)
 
@@ -263,9 +305,7 @@ class BaseTree:
         if (
             hash_info
             and hash_info.isdir
-            and not self.cache.tree.exists(
-                self.cache.tree.hash_to_path_info(hash_info.value)
-            )
+            and not self.cache.dir_cache_exists(hash_info)
         ):
             hash_info = None
 
@@ -291,16 +331,80 @@ class BaseTree:
     def hash_to_path_info(self, hash_):
         return self.path_info / hash_[0:2] / hash_[2:]
 
-    def _calculate_hashes(self, file_infos):
-        with Tqdm(
-            total=len(file_infos),
-            unit="md5",
-            desc="Computing file/dir hashes (only done once)",
-        ) as pbar:
-            worker = pbar.wrap_fn(self.get_file_hash)
-            with ThreadPoolExecutor(max_workers=self.hash_jobs) as executor:
-                hash_infos = executor.map(worker, file_infos)
-                return dict(zip(file_infos, hash_infos))
+    def _calculate_hashes(self, items):
+        """Lazily hash files, yielding (file_info, hash_info) pairs.
+
+        `items` are (file_info, hash_info) pairs, where hash_info is None for
+        the files that still need to be hashed. Pairs that already have a
+        hash are passed through as soon as they are consumed, the rest are
+        hashed by `hash_jobs` workers with at most `hash_jobs * 4` chunks in
+        flight, so only a bounded number of entries is held in memory.
+        The progress bar and the workers are only started once there is
+        something to hash.
+        """
+        max_pending = self.hash_jobs * 4
+        pending = deque()
+
+        def _hash_chunk(chunk):
+            return list(zip(chunk, map(self.get_file_hash, chunk)))
+
+        with ExitStack() as stack:
+            pbar = None
+            executor = None
+
+            def _submit(chunk):
+                nonlocal pbar, executor
+                if executor is None:
+                    pbar = stack.enter_context(
+                        Tqdm(
+                            unit="md5",
+                            desc="Computing file/dir hashes (only done once)",
+                            mininterval=0.5,
+                        )
+                    )
+                    executor = stack.enter_context(
+                        ThreadPoolExecutor(max_workers=self.hash_jobs)
+                    )
+                pending.append(executor.submit(_hash_chunk, chunk))
+
+            def _chunk_result(future):
+                # NOTE: progress is updated once per chunk from this thread
+                # rather than per file from the workers (i.e. wrap_fn), which
+                # kept the bar's lock on the hashing hot path.
+                result = future.result()
+                pbar.update(len(result))
+                return result
+
+            # NOTE: submitting one task per file makes executor overhead
+            # dominate for large numbers of small files, so chunks grow with
+            # the number of files seen so far (up to HASH_CHUNK_SIZE), while
+            # small directories are still spread across all workers.
+            chunk = []
+            count = 0
+            for file_info, hash_info in items:
+                if hash_info:
+                    yield file_info, hash_info
+                    continue
+
+                chunk.append(file_info)
+                count += 1
+                if len(chunk) < self._hash_chunk_size(count):
+                    continue
+
+                if len(pending) >= max_pending:
+                    yield from _chunk_result(pending.popleft())
+                _submit(chunk)
+                chunk = []
+                while pending and pending[0].done():
+                    yield from _chunk_result(pending.popleft())
+
+            if chunk:
+                _submit(chunk)
+            while pending:
+                yield from _chunk_result(pending.popleft())
+
+    def _hash_chunk_size(self, total):
+        return max(1, min(self.HASH_CHUNK_SIZE, total // (self.hash_jobs * 4)))
 
     def _iter_hashes(self, path_info, **kwargs):
         if self.PARAM_CHECKSUM in self.DETAIL_FIELDS:
@@ -315,17 +419,39 @@ class BaseTree:
 
             return None
 
-        file_infos = []
-        for file_info in self.walk_files(path_info, **kwargs):
-            hash_info = self.state.get(  # pylint: disable=assignment-from-none
-                file_info
-            )
-            if not hash_info:
-                file_infos.append(file_info)
-                continue
+        # stats of the files being hashed, taken before hashing them
+        missing = {}
+
+        def _iter_state_hashes():
+            walk = self._walk_files_entries(path_info, **kwargs)
+            for chunk in chunks(self.STATE_CHUNK_SIZE, walk):
+                # NOTE: query state db for a whole chunk of files at once
+                # rather than issuing one query per file, reusing whatever
+                # stat results the walk has already got for them
+                entries = {fi: entry for fi, entry in chunk if entry}
+                stats = self.state.stat_many(
+                    [fi for fi, _ in chunk], entries=entries
+                )
+                hash_infos = self.state.get_many(stats)
+                for file_info, _ in chunk:
+                    hash_info = hash_infos.get(file_info)
+                    if not hash_info and file_info in stats:
+                        missing[file_info] = stats[file_info]
+                    yield file_info, hash_info
+
+        computed = []
+        for file_info, hash_info in self._calculate_hashes(
+            _iter_state_hashes()
+        ):
+            stats = missing.pop(file_info, None)
+            if stats and hash_info:
+                computed.append((stats, hash_info))
+                if len(computed) >= self.STATE_CHUNK_SIZE:
+                    self.state.save_many(computed)
+                    computed.clear()
             yield file_info, hash_info
 
-        yield from self._calculate_hashes(file_infos).items()
+        self.state.save_many(computed)
 
     def _collect_dir(self, path_info, **kwargs):
         dir_info = DirInfo()
@@ -341,7 +467,7 @@ class BaseTree:
             #
             # Yes, this is a BUG, as long as we permit "/" in
             # filenames on Windows and "\" on Unix
-            dir_info.trie[fi.relative_to(path_info).parts] = hi
+            dir_info.add(fi.relative_to(path_info).parts, hi)
 
         return dir_info
 
@@ -416,9 +542,15 @@ class BaseTree:
         self, from_info, to_info, name, no_progress_bar, jobs, **kwargs,
     ):
         from_infos = list(self.walk_files(from_info, **kwargs))
-        to_infos = (
+        to_infos = [
             to_info / info.relative_to(from_info) for info in from_infos
-        )
+        ]
+
+        # NOTE: create each destination directory once up front instead of
+        # calling makedirs() for every downloaded file.
+        parents = {info.parent for info in to_infos}
+        for parent in sorted(parents, key=lambda info: len(info.parts)):
+            makedirs(parent, exist_ok=True)
 
         with Tqdm(
             total=len(from_infos),
@@ -427,42 +559,66 @@ class BaseTree:
             disable=no_progress_bar,
         ) as pbar:
             download_files = pbar.wrap_fn(
-                partial(self._download_file, name=name, no_progress_bar=True,)
+                partial(
+                    self._download_file,
+                    name=name,
+                    no_progress_bar=True,
+                    skip_makedirs=True,
+                )
             )
             max_workers = jobs or self.jobs
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = [
-                    executor.submit(download_files, from_info, to_info)
-                    for from_info, to_info in zip(from_infos, to_infos)
-                ]
-
-                # NOTE: unlike pulling/fetching cache, where we need to
-                # download everything we can, not raising an error here might
-                # turn very ugly, as the user might think that he has
-                # downloaded a complete directory, while having a partial one,
-                # which might cause unexpected results in his pipeline.
-                for future in as_completed(futures):
-                    # NOTE: executor won't let us raise until all futures that
-                    # it has are finished, so we need to cancel them ourselves
-                    # before re-raising.
-                    exc = future.exception()
-                    if exc:
-                        for entry in futures:
-                            entry.cancel()
-                        raise exc
+                infos = zip(from_infos, to_infos)
+
+                def create_tasks(amount):
+                    return {
+                        executor.submit(download_files, from_info, to_info)
+                        for from_info, to_info in itertools.islice(
+                            infos, amount
+                        )
+                    }
+
+                # NOTE: only keep a bounded number of downloads queued in the
+                # executor instead of creating a future for every file.
+                tasks = create_tasks(max_workers * 5)
+                while tasks:
+                    done, tasks = futures.wait(
+                        tasks, return_when=futures.FIRST_COMPLETED
+                    )
+                    # NOTE: unlike pulling/fetching cache, where we need to
+                    # download everything we can, not raising an error here
+                    # might turn very ugly, as the user might think that he
+                    # has downloaded a complete directory, while having a
+                    # partial one, which might cause unexpected results in his
+                    # pipeline.
+                    for task in done:
+                        # NOTE: executor won't let us raise until all futures
+                        # that it has are finished, so we need to cancel them
+                        # ourselves before re-raising.
+                        exc = task.exception()
+                        if exc:
+                            for entry in tasks:
+                                entry.cancel()
+                            raise exc
+                    tasks.update(create_tasks(len(done)))
 
     def _download_file(
-        self, from_info, to_info, name, no_progress_bar,
+        self, from_info, to_info, name, no_progress_bar, skip_makedirs=False,
     ):
-        makedirs(to_info.parent, exist_ok=True)
+        if not skip_makedirs:
+            makedirs(to_info.parent, exist_ok=True)
 
         logger.debug("Downloading '%s' to '%s'", from_info, to_info)
         name = name or to_info.name
 
+        # NOTE: tmp file is always next to to_info, so it is on the same
+        # filesystem and a plain rename is enough to move it into place
+        # atomically, without the extra stat/rename calls that
+        # dvc.utils.fs.move() does to support cross-device moves.
         tmp_file = tmp_fname(to_info)
 
         self._download(  # noqa, pylint: disable=no-member
             from_info, tmp_file, name=name, no_progress_bar=no_progress_bar
         )
 
-        move(tmp_file, to_info)
+        os.replace(tmp_file, to_info)
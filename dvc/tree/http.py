@@ -30,6 +30,7 @@ class HTTPTree(BaseTree):  # pylint:disable=abstract-method
     PATH_CLS = HTTPURLInfo
     PARAM_CHECKSUM = "etag"
     CAN_TRAVERSE = False
+    MAX_JOBS = 16
 
     SESSION_RETRIES = 5
     SESSION_BACKOFF_FACTOR = 0.1
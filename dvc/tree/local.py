@@ -21,6 +21,7 @@ class LocalTree(BaseTree):
     PARAM_CHECKSUM = "md5"
     PARAM_PATH = "path"
     TRAVERSE_PREFIX_LEN = 2
+    MAX_JOBS = None
 
     def __init__(self, repo, config, use_dvcignore=False, dvcignore_root=None):
         super().__init__(repo, config)
@@ -111,10 +112,49 @@ class LocalTree(BaseTree):
             yield os.path.normpath(root), dirs, files
 
     def walk_files(self, path_info, **kwargs):
-        for root, _, files in self.walk(path_info):
-            for file in files:
-                # NOTE: os.path.join is ~5.5 times slower
-                yield PathInfo(f"{root}{os.sep}{file}")
+        for file_info, _ in self._walk_files_entries(path_info):
+            yield file_info
+
+    def _walk_files_entries(self, path_info, **kwargs):
+        """Same as `walk_files`, but also yields the `os.DirEntry` for each
+        file, so that callers can reuse its cached stat results.
+
+        NOTE: unlike `os.walk`, this doesn't build a list of `(dirs, files)`
+        names for every directory and then throw the `os.DirEntry` objects
+        away, which `os.walk` does internally.
+        """
+        top = os.path.normpath(path_info)
+        try:
+            with os.scandir(top) as scandir_it:
+                entries = list(scandir_it)
+        except OSError:
+            return
+
+        dirs = {}
+        files = {}
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                dirs[entry.name] = entry
+            else:
+                files[entry.name] = entry
+
+        dirnames, filenames = self.dvcignore(
+            os.path.abspath(top), list(dirs), list(files)
+        )
+
+        for name in filenames:
+            # NOTE: os.path.join is ~5.5 times slower
+            yield PathInfo(f"{top}{os.sep}{name}"), files[name]
+
+        for name in dirnames:
+            # NOTE: same as `os.walk`, symlinked dirs are not followed
+            if dirs[name].is_symlink():
+                continue
+            yield from self._walk_files_entries(f"{top}{os.sep}{name}")
 
     def is_empty(self, path_info):
         if self.isfile(path_info) and os.path.getsize(path_info) == 0:
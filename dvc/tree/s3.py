@@ -26,6 +26,7 @@ class S3Tree(BaseTree):
     REQUIRES = {"boto3": "boto3"}
     PARAM_CHECKSUM = "etag"
     DETAIL_FIELDS = frozenset(("etag", "size"))
+    MAX_JOBS = 32
 
     def __init__(self, repo, config):
         super().__init__(repo, config)
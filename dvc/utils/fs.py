@@ -61,6 +61,25 @@ def get_mtime_and_size(path, tree):
     return str(mtime), str(size)
 
 
+def get_entry_inode_mtime_and_size(entry):
+    """Same as `get_inode()` plus `get_mtime_and_size()` for a file, but
+    reuses the stat results that `os.DirEntry` has already cached.
+    """
+    import nanotime
+
+    stats = entry.stat()
+    if System.is_unix() and not entry.is_symlink():
+        # NOTE: see System.inode() for the c_ulong cast
+        import ctypes
+
+        inode = ctypes.c_ulong(stats.st_ino).value
+    else:
+        inode = get_inode(entry.path)
+    mtime = int(nanotime.timestamp(stats.st_mtime))
+
+    return inode, str(mtime), str(stats.st_size)
+
+
 class BasePathNotInCheckedPathException(DvcException):
     def __init__(self, path, base_path):
         msg = "Path: {} does not overlap with base path: {}".format(
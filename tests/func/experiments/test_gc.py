@@ -118,3 +118,59 @@ def test_all_tags(tmp_dir, scm, dvc, queued, expected):
 
     removed = dvc.experiments.gc(all_tags=True, queued=queued)
     assert removed == expected
+
+
+@pytest.mark.parametrize("branch_exp", ["stale", "kept"])
+def test_exec_refs(tmp_dir, scm, dvc, branch_exp):
+    from dvc.repo.experiments.base import (
+        EXEC_APPLY,
+        EXEC_BRANCH,
+        EXEC_CHECKPOINT,
+    )
+    from dvc.repo.experiments.utils import exp_refs
+
+    tmp_dir.gen("copy.py", COPY_SCRIPT)
+    tmp_dir.gen("params.yaml", "foo: 1")
+
+    stage = dvc.run(
+        cmd="python copy.py params.yaml metrics.yaml",
+        metrics_no_cache=["metrics.yaml"],
+        params=["foo"],
+        name="foo",
+    )
+    scm.add(["dvc.yaml", "dvc.lock", "copy.py", "params.yaml", "metrics.yaml"])
+    scm.commit("v1")
+
+    stale_rev = first(dvc.experiments.run(stage.addressing, params=["foo=2"]))
+    (stale_ref,) = map(str, exp_refs(scm))
+
+    tmp_dir.gen("params.yaml", "foo: 3")
+    dvc.reproduce(stage.addressing)
+    scm.add(["dvc.yaml", "dvc.lock", "params.yaml", "metrics.yaml"])
+    scm.commit("v2")
+
+    kept_rev = first(dvc.experiments.run(stage.addressing, params=["foo=4"]))
+    (kept_ref,) = set(map(str, exp_refs(scm))) - {stale_ref}
+
+    branch_ref = stale_ref if branch_exp == "stale" else kept_ref
+    scm.set_ref(EXEC_BRANCH, branch_ref, symbolic=True)
+    scm.set_ref(EXEC_APPLY, stale_rev)
+    scm.set_ref(EXEC_CHECKPOINT, kept_rev)
+
+    assert dvc.experiments.gc(workspace=True) == 1
+
+    assert list(map(str, exp_refs(scm))) == [kept_ref]
+    if branch_exp == "stale":
+        assert scm.get_ref(EXEC_BRANCH, follow=False) is None
+    else:
+        assert scm.get_ref(EXEC_BRANCH, follow=False) == kept_ref
+    assert scm.get_ref(EXEC_APPLY) is None
+    assert scm.get_ref(EXEC_CHECKPOINT) == kept_rev
+
+
+def test_no_exp_refs(tmp_dir, scm, dvc, mocker):
+    tmp_dir.scm_gen("foo", "foo", commit="init")
+    brancher = mocker.spy(dvc, "brancher")
+
+    assert dvc.experiments.gc(workspace=True) == 0
+    brancher.assert_not_called()
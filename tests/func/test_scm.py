@@ -242,6 +242,28 @@ def test_git_stash_drop(tmp_dir, scm, ref):
     assert len(stash) == 1
 
 
+@pytest.mark.parametrize("ref", [None, "refs/foo/stash"])
+def test_git_stash_drop_many(tmp_dir, scm, ref):
+    from dvc.scm.git import Stash
+
+    tmp_dir.scm_gen({"file": "0"}, commit="init")
+    stash = Stash(scm, ref=ref)
+    revs = []
+    for i in range(1, 5):
+        tmp_dir.gen("file", str(i))
+        revs.insert(0, stash.push())
+
+    stash.drop_many([2, 0])
+    assert len(stash) == 2
+    assert revs[1] == scm.resolve_rev(f"{stash.ref}@{{0}}")
+    assert revs[3] == scm.resolve_rev(f"{stash.ref}@{{1}}")
+
+    stash.drop_many([0, 1])
+    assert len(stash) == 0
+    parts = list(stash.ref.split("/"))
+    assert not os.path.exists(os.path.join(os.fspath(tmp_dir), ".git", *parts))
+
+
 @pytest.mark.parametrize("ref", [None, "refs/foo/stash"])
 def test_git_stash_pop(tmp_dir, scm, ref):
     from dvc.scm.git import Stash
@@ -31,6 +31,81 @@ def test_state(tmp_dir, dvc):
         assert state.get(path_info) == hash_info
 
 
+def test_state_get_many(tmp_dir, dvc):
+    tmp_dir.gen({"foo": "foo content", "bar": "bar content"})
+    foo = PathInfo(tmp_dir / "foo")
+    bar = PathInfo(tmp_dir / "bar")
+    missing = PathInfo(tmp_dir / "missing")
+    foo_hash = HashInfo("md5", file_md5(foo)[0], size=11)
+    bar_hash = HashInfo("md5", file_md5(bar)[0], size=11)
+
+    state = State(dvc)
+
+    with state:
+        state.save(foo, foo_hash)
+        state.save(bar, bar_hash)
+        stats = state.stat_many([foo, bar, missing])
+        assert set(stats) == {foo, bar}
+        assert state.get_many(stats) == {foo: foo_hash, bar: bar_hash}
+
+        (tmp_dir / "bar").unlink()
+        (tmp_dir / "bar").write_text("1")
+
+        assert state.get_many(state.stat_many([foo, bar])) == {foo: foo_hash}
+
+
+def test_state_get_many_entries(tmp_dir, dvc):
+    tmp_dir.gen({"dir": {"foo": "foo content", "bar": "bar content"}})
+    foo = PathInfo(tmp_dir / "dir" / "foo")
+    foo_hash = HashInfo("md5", file_md5(foo)[0], size=11)
+
+    state = State(dvc)
+    entries = dict(dvc.tree._walk_files_entries(PathInfo(tmp_dir / "dir")))
+    assert set(entries) == {foo, PathInfo(tmp_dir / "dir" / "bar")}
+
+    with state:
+        state.save(foo, foo_hash)
+        with mock.patch("dvc.state.get_mtime_and_size") as mock_mtime:
+            stats = state.stat_many(list(entries), entries=entries)
+        mock_mtime.assert_not_called()
+        assert stats == state.stat_many(list(entries))
+        assert state.get_many(stats) == {foo: foo_hash}
+
+
+def test_state_save_many(tmp_dir, dvc):
+    tmp_dir.gen({"foo": "foo content", "bar": "bar content"})
+    foo = PathInfo(tmp_dir / "foo")
+    bar = PathInfo(tmp_dir / "bar")
+    foo_hash = HashInfo("md5", file_md5(foo)[0])
+    bar_hash = HashInfo("md5", file_md5(bar)[0])
+
+    state = State(dvc)
+
+    with state:
+        state.save(foo, HashInfo("md5", "outdated"))
+        stats = state.stat_many([foo, bar])
+        state.save_many([(stats[foo], foo_hash), (stats[bar], bar_hash)])
+        assert state.get(foo) == foo_hash
+        assert state.get(bar) == bar_hash
+        assert state.inserts == 2
+
+
+def test_state_save_many_changed(tmp_dir, dvc):
+    tmp_dir.gen("foo", "foo content")
+    foo = PathInfo(tmp_dir / "foo")
+    foo_hash = HashInfo("md5", file_md5(foo)[0])
+
+    state = State(dvc)
+
+    with state:
+        stats = state.stat_many([foo])
+        # changed after being hashed, but before its hash got saved
+        with open(foo, "a") as fobj:
+            fobj.write("modified")
+        state.save_many([(stats[foo], foo_hash)])
+        assert state.get(foo) is None
+
+
 def test_state_overflow(tmp_dir, dvc):
     # NOTE: trying to add more entries than state can handle,
     # to see if it will clean up and vacuum successfully
@@ -99,3 +174,25 @@ def test_get_unused_links(tmp_dir, dvc):
                 + [os.path.join(dvc.root_dir, "not-existing-file")]
             )
         ) == {"bar"}
+
+
+def test_state_dir_file_changed_while_hashing(tmp_dir, dvc, mocker):
+    tmp_dir.gen({"dir": {"foo": "foo content", "bar": "bar content"}})
+    foo = PathInfo(tmp_dir / "dir" / "foo")
+    bar = PathInfo(tmp_dir / "dir" / "bar")
+    tree = dvc.cache.local.tree
+    get_file_hash = tree.get_file_hash
+
+    def _get_file_hash(path_info):
+        hash_info = get_file_hash(path_info)
+        if path_info == foo:
+            with open(foo, "a") as fobj:
+                fobj.write("modified")
+        return hash_info
+
+    mocker.patch.object(tree, "get_file_hash", side_effect=_get_file_hash)
+    with dvc.state:
+        tree.get_dir_hash(PathInfo(tmp_dir / "dir"))
+        assert set(dvc.state.get_many(dvc.state.stat_many([foo, bar]))) == {
+            bar
+        }
@@ -86,3 +86,30 @@ def test_set_exec_ignore_errors(tmp_dir, dvc, mocker, err):
     )
     dvc.cache.local.set_exec(PathInfo("foo"))
     assert mock_chmod.called
+
+
+def test_dir_cache_exists(tmp_dir, dvc, mocker):
+    (stage,) = tmp_dir.dvc_gen({"dir": {"foo": "foo", "bar": "bar"}})
+    hash_info = stage.outs[0].hash_info
+    cache = LocalCache(dvc.cache.local.tree)
+    exists = mocker.spy(cache.tree, "exists")
+
+    assert cache.dir_cache_exists(hash_info)
+    assert cache.dir_cache_exists(hash_info)
+    assert exists.call_count == 1
+
+    # corrupted .dir cache file gets removed and forgotten
+    path = cache.tree.hash_to_path_info(hash_info.value)
+    os.chmod(path, 0o644)
+    with open(path, "w") as fobj:
+        fobj.write("corrupted")
+    assert cache.changed_cache_file(hash_info)
+    assert not cache.dir_cache_exists(hash_info)
+
+    # .dir cache file removed by gc is forgotten
+    (tmp_dir / "dir").gen("baz", "baz")
+    (stage,) = dvc.add("dir")
+    hash_info = stage.outs[0].hash_info
+    assert cache.dir_cache_exists(hash_info)
+    assert cache.gc(set())
+    assert not cache.dir_cache_exists(hash_info)
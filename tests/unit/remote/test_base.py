@@ -72,7 +72,7 @@ def test_hashes_exist(object_exists, traverse, dvc):
     # large remote, large local
     object_exists.reset_mock()
     traverse.reset_mock()
-    cache.tree.JOBS = 16
+    cache.tree.jobs = 16
     with mock.patch.object(
         cache, "list_hashes", return_value=list(range(256))
     ):
@@ -98,7 +98,7 @@ def test_list_hashes_traverse(_path_to_hash, list_hashes, dvc):
     cache.tree.path_info = PathInfo("foo")
 
     # parallel traverse
-    size = 256 / cache.tree.JOBS * cache.tree.LIST_OBJECT_PAGE_SIZE
+    size = 256 / cache.tree.jobs * cache.tree.LIST_OBJECT_PAGE_SIZE
     list(cache.list_hashes_traverse(size, {0}))
     for i in range(1, 16):
         list_hashes.assert_any_call(
@@ -39,7 +39,7 @@ def test_remote_without_hash_jobs_default(dvc):
     dvc.config["remote"]["without_hash_jobs"] = {"url": "s3://bucket/name"}
 
     tree = get_cloud_tree(dvc, name="without_hash_jobs")
-    assert tree.hash_jobs == tree.HASH_JOBS
+    assert tree.hash_jobs == tree._default_hash_jobs()
 
 
 @pytest.mark.parametrize("tree_cls", [GSTree, S3Tree])
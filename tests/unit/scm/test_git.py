@@ -183,6 +183,48 @@ def test_get_ref(tmp_dir, git):
     assert git.get_ref("refs/foo/qux") is None
 
 
+def test_get_refs(tmp_dir, git):
+    tmp_dir.scm_gen({"file": "0"}, commit="init")
+    init_rev = tmp_dir.scm.get_rev()
+    tmp_dir.gen(
+        {
+            os.path.join(".git", "refs", "foo", "bar"): init_rev,
+            os.path.join(
+                ".git", "refs", "foo", "baz"
+            ): "ref: refs/heads/master",
+            os.path.join(".git", "refs", "qux", "quux"): init_rev,
+            os.path.join(".git", "refs", "foobar", "bar"): init_rev,
+            os.path.join(".git", "packed-refs"): (
+                f"{init_rev} refs/foobaz/bar\n"
+            ),
+        }
+    )
+
+    assert {
+        "refs/foo/bar": init_rev,
+        "refs/foo/baz": init_rev,
+    } == git.get_refs("refs/foo")
+    assert git.get_refs("refs/foo/") == git.get_refs("refs/foo")
+    assert {"refs/foo/bar": init_rev} == git.get_refs("refs/foo/bar")
+    assert {} == git.get_refs("refs/fo")
+    assert {"refs/foobaz/bar": init_rev} == git.get_refs("refs/foobaz")
+    assert git.get_refs()["refs/qux/quux"] == init_rev
+
+
+def test_has_any_ref(tmp_dir, git):
+    tmp_dir.scm_gen({"file": "0"}, commit="init")
+    init_rev = tmp_dir.scm.get_rev()
+
+    assert not git.has_any_ref("refs/foo")
+    tmp_dir.gen(os.path.join(".git", "refs", "foo", "bar"), init_rev)
+    assert git.has_any_ref("refs/foo")
+    assert git.has_any_ref("refs/foo/")
+    assert git.has_any_ref("refs/foo/bar")
+    assert not git.has_any_ref("refs/fo")
+    assert not git.has_any_ref("refs/foo/ba")
+    assert git.has_any_ref()
+
+
 def test_remove_ref(tmp_dir, git):
     tmp_dir.scm_gen({"file": "0"}, commit="init")
     init_rev = tmp_dir.scm.get_rev()
@@ -196,6 +238,24 @@ def test_remove_ref(tmp_dir, git):
     assert not (tmp_dir / ".git" / "refs" / "foo" / "bar").exists()
 
 
+def test_remove_refs(tmp_dir, git):
+    if git.test_backend != "gitpython":
+        pytest.skip()
+
+    tmp_dir.scm_gen({"file": "0"}, commit="init")
+    init_rev = tmp_dir.scm.get_rev()
+    tmp_dir.gen(
+        {
+            os.path.join(".git", "refs", "foo", "bar"): init_rev,
+            os.path.join(".git", "refs", "foo", "baz"): init_rev,
+            os.path.join(".git", "refs", "foo", "qux"): init_rev,
+        }
+    )
+
+    git.remove_refs(["refs/foo/bar", "refs/foo/baz"])
+    assert {"refs/foo/qux": init_rev} == git.get_refs("refs/foo")
+
+
 def test_refs_containing(tmp_dir, scm):
     tmp_dir.scm_gen({"file": "0"}, commit="init")
     init_rev = scm.get_rev()
@@ -58,6 +58,23 @@ def test_list(lst, trie_dict):
     assert dir_info.to_list() == sorted(lst, key=itemgetter("relpath"))
 
 
+def test_add():
+    dir_info = DirInfo()
+    dir_info.trie = Trie({("a",): HashInfo("md5", "abc", size=1)})
+    dir_info.add(("dir", "b"), HashInfo("md5", "def", size=2))
+
+    assert dir_info.nfiles == 2
+    assert dir_info.size == 3
+    assert list(dir_info.items()) == [
+        ("a", HashInfo("md5", "abc")),
+        ("dir/b", HashInfo("md5", "def")),
+    ]
+    assert dir_info.trie == Trie(
+        {("a",): HashInfo("md5", "abc"), ("dir", "b"): HashInfo("md5", "def")}
+    )
+    assert dir_info.nfiles == 2
+
+
 @pytest.mark.parametrize(
     "trie_dict, size",
     [
@@ -17,3 +17,43 @@ def test_missing_deps(pkg, msg, mocker):
     mocker.patch("dvc.utils.pkg.PKG", pkg)
     with pytest.raises(RemoteMissingDepsError, match=msg):
         BaseTree(None, {})
+
+
+def test_calculate_hashes(mocker):
+    tree = BaseTree(None, {})
+    mocker.patch.object(
+        tree, "get_file_hash", side_effect=lambda file_info: file_info * 2
+    )
+
+    items = ((str(i), None) for i in range(1000))
+    assert list(tree._calculate_hashes(items)) == [
+        (str(i), str(i) * 2) for i in range(1000)
+    ]
+
+
+def test_calculate_hashes_known(mocker):
+    tree = BaseTree(None, {})
+    get_file_hash = mocker.patch.object(tree, "get_file_hash")
+    tqdm = mocker.patch("dvc.tree.base.Tqdm")
+
+    items = ((str(i), str(i) * 2) for i in range(1000))
+    hashes = tree._calculate_hashes(items)
+    # known hashes are passed through without consuming the rest of items
+    assert next(hashes) == ("0", "00")
+    assert next(items) == ("1", "11")
+    assert list(hashes) == [(str(i), str(i) * 2) for i in range(2, 1000)]
+
+    get_file_hash.assert_not_called()
+    tqdm.assert_not_called()
+
+
+def test_default_jobs_capped(mocker):
+    mocker.patch.object(BaseTree, "JOBS", 384)
+    assert BaseTree(None, {}).jobs == BaseTree.MAX_JOBS
+    assert BaseTree(None, {"jobs": 100}).jobs == 100
+
+
+def test_default_jobs_available_cpus(mocker):
+    mocker.patch.object(BaseTree, "_cpu_count", return_value=2)
+    assert BaseTree(None, {}).jobs == 8
+    assert BaseTree(None, {}).hash_jobs == 1